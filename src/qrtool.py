@@ -14,14 +14,26 @@ Examples:
 
     # Email address
     python src/qrtool.py "you@example.com" --mode email --out email.png
+
+    # Many QR codes in parallel from a JSON list of jobs
+    python src/qrtool.py --batch jobs.json --logo examples/plex_logo.png --auto-style
 """
 
+from __future__ import annotations
+
 import argparse
+import functools
+import json
 from pathlib import Path
-from typing import Tuple
+from typing import TYPE_CHECKING, Tuple
 
-import qrcode
-from PIL import Image, ImageDraw
+if TYPE_CHECKING:
+    import numpy as np
+    from PIL import Image
+
+# numpy, qrcode/segno, Pillow and the process pool are imported inside the
+# functions that need them so that --help and argument errors don't pay
+# for loading them.
 
 
 # PLEX palette (subset needed for auto styling)
@@ -37,6 +49,85 @@ PLEX_PALETTE = {
     "bg_elevated": (0xF8, 0xF7, 0xFF),
 }
 
+# Fill candidates only (backgrounds are never used as the primary fill),
+# as parallel per-channel tuples; _palette_rgb() is the NumPy form
+_FILL_NAMES: Tuple[str, ...] = tuple(name for name in PLEX_PALETTE if not name.startswith("bg_"))
+_FILL_R: Tuple[int, ...] = tuple(PLEX_PALETTE[name][0] for name in _FILL_NAMES)
+_FILL_G: Tuple[int, ...] = tuple(PLEX_PALETTE[name][1] for name in _FILL_NAMES)
+_FILL_B: Tuple[int, ...] = tuple(PLEX_PALETTE[name][2] for name in _FILL_NAMES)
+
+
+def _relative_luminance(rgb: Tuple[int, int, int]) -> float:
+    """WCAG relative luminance of an sRGB colour."""
+    def channel(v: int) -> float:
+        c = v / 255
+        return c / 12.92 if c <= 0.03928 else ((c + 0.055) / 1.055) ** 2.4
+
+    r, g, b = (channel(v) for v in rgb)
+    return 0.2126 * r + 0.7152 * g + 0.0722 * b
+
+
+# Fill candidates too close to bg_main to scan reliably (lavender is ~1.2:1)
+# never win the auto-style vote
+_MIN_FILL_CONTRAST = 1.5
+_BG_MAIN_LUMINANCE = _relative_luminance(PLEX_PALETTE["bg_main"])
+_FILL_SCANNABLE: Tuple[bool, ...] = tuple(
+    (_BG_MAIN_LUMINANCE + 0.05) / (_relative_luminance((r, g, b)) + 0.05) >= _MIN_FILL_CONTRAST
+    for r, g, b in zip(_FILL_R, _FILL_G, _FILL_B)
+)
+
+
+@functools.cache
+def _palette_rgb() -> np.ndarray:
+    """(K, 3) int32 array of the fill candidates, in _FILL_NAMES order."""
+    import numpy as np
+
+    return np.array([_FILL_R, _FILL_G, _FILL_B], dtype=np.int32).T
+
+
+def _nearest_palette_index(rgbs: np.ndarray) -> np.ndarray:
+    """Index of the nearest fill candidate for each row of an (N, 3) array."""
+    diffs = rgbs[:, None, :] - _palette_rgb()[None, :, :]
+    return (diffs * diffs).sum(axis=2).argmin(axis=1)
+
+
+_LUT_AMBIGUOUS = 255
+
+
+@functools.cache
+def _palette_lut() -> np.ndarray:
+    """
+    Map every 5-bit-per-channel RGB cell (32x32x32) to the index of its
+    nearest fill candidate, indexed by ((r >> 3) << 10) | ((g >> 3) << 5) | (b >> 3).
+    Built on first use rather than at import, so --help doesn't pay for it.
+
+    Nearest-colour regions are convex, so a cell whose 8 corners agree maps
+    to that colour throughout. Cells straddling a boundary are marked with
+    _LUT_AMBIGUOUS and resolved exactly at lookup time.
+    """
+    import numpy as np
+
+    cells = np.indices((32, 32, 32), dtype=np.int32).reshape(3, -1).T * 8
+    corners = np.stack(
+        [_nearest_palette_index(cells + offset) for offset in np.indices((2, 2, 2)).reshape(3, -1).T * 7],
+        axis=1,
+    )
+    lut = corners[:, 0].astype(np.uint8)
+    lut[(corners != corners[:, :1]).any(axis=1)] = _LUT_AMBIGUOUS
+    return lut
+
+
+def _palette_indices(pixels: np.ndarray) -> np.ndarray:
+    """Nearest fill-candidate index for each row of an (N, 3) uint8 array, via the LUT."""
+    import numpy as np
+
+    p = pixels.astype(np.intp)
+    idx = _palette_lut()[((p[:, 0] >> 3) << 10) | ((p[:, 1] >> 3) << 5) | (p[:, 2] >> 3)]
+    ambiguous = idx == _LUT_AMBIGUOUS
+    if ambiguous.any():
+        idx[ambiguous] = _nearest_palette_index(p[ambiguous])
+    return idx
+
 
 def rgb_to_hex(rgb: Tuple[int, int, int]) -> str:
     return "#{:02X}{:02X}{:02X}".format(*rgb)
@@ -45,75 +136,109 @@ def rgb_to_hex(rgb: Tuple[int, int, int]) -> str:
 def nearest_palette_colour(rgb: Tuple[int, int, int]) -> Tuple[str, Tuple[int, int, int]]:
     """Return (name, rgb) of the closest PLEX palette colour to the given rgb."""
     r, g, b = rgb
-    best_name = "deep_lilac"
-    best_rgb = PLEX_PALETTE[best_name]
-    best_dist = float("inf")
-
-    for name, (pr, pg, pb) in PLEX_PALETTE.items():
-        if name.startswith("bg_"):
-            # skip backgrounds as primary fill candidates
-            continue
-        dr = r - pr
-        dg = g - pg
-        db = b - pb
-        dist = dr * dr + dg * dg + db * db
-        if dist < best_dist:
-            best_dist = dist
-            best_name = name
-            best_rgb = (pr, pg, pb)
-
-    return best_name, best_rgb
+    idx = int(_palette_lut()[((r >> 3) << 10) | ((g >> 3) << 5) | (b >> 3)])
+    if idx == _LUT_AMBIGUOUS:
+        # Exact scan for cells on a boundary; for one colour a plain loop
+        # is cheaper than building NumPy arrays
+        best_dist = None
+        for i in range(len(_FILL_NAMES)):
+            dr = r - _FILL_R[i]
+            dg = g - _FILL_G[i]
+            db = b - _FILL_B[i]
+            dist = dr * dr + dg * dg + db * db
+            if best_dist is None or dist < best_dist:
+                best_dist = dist
+                idx = i
+    return _FILL_NAMES[idx], (_FILL_R[idx], _FILL_G[idx], _FILL_B[idx])
+
+
+@functools.lru_cache(maxsize=4)
+def _decode_logo(path: str, mtime_ns: int) -> Image.Image:
+    from PIL import Image
+
+    with Image.open(path) as img:
+        return img.convert("RGBA")
+
+
+def _load_logo(logo_path: Path) -> Image.Image:
+    """
+    Open the logo as RGBA, reusing the decoded image while the file is
+    unchanged (keyed on path and mtime). The result is shared; copy it
+    before modifying.
+    """
+    return _decode_logo(str(logo_path), logo_path.stat().st_mtime_ns)
+
+
+@functools.lru_cache(maxsize=4)
+def _logo_fill_rgb(path: str, mtime_ns: int) -> Tuple[int, int, int]:
+    """
+    Fill colour voted from the logo's pixels, cached per path and mtime so
+    repeated runs with the same (possibly very large) logo skip the resize.
+    """
+    import numpy as np
+    from PIL import Image
+
+    # Downscale to keep things cheap; a cheap area average is enough to vote with
+    img = _decode_logo(path, mtime_ns).resize((32, 32), Image.Resampling.BOX)
+    # uint8 view of the pixels; no widening copy
+    arr = np.asarray(img).reshape(-1, 4)
+
+    # keep pixels that are not near-transparent and not very bright white;
+    # "any channel <= 245" avoids a separate negation, and the white test
+    # is ANDed into the alpha mask in place
+    mask = np.greater_equal(arr[:, 3], 32)
+    mask &= np.less_equal(arr[:, :3], 245).any(axis=1)
+    pixels = arr[mask, :3]
+
+    if len(pixels) == 0:
+        # If logo is basically all white/transparent, pick a nice default
+        return PLEX_PALETTE["deep_lilac"]
+
+    # A vote rather than a mean: distinct colour regions would average
+    # into a muddy in-between shade. Votes for colours that would vanish
+    # against the background are discarded.
+    votes = np.bincount(_palette_indices(pixels), minlength=len(_FILL_NAMES))
+    votes[~np.array(_FILL_SCANNABLE)] = 0
+
+    if not votes.any():
+        # Only pale, background-like colours: same default
+        return PLEX_PALETTE["deep_lilac"]
+
+    fill_idx = int(votes.argmax())
+    return _FILL_R[fill_idx], _FILL_G[fill_idx], _FILL_B[fill_idx]
 
 
 def infer_qr_colours_from_logo(logo_path: Path) -> Tuple[str, str]:
     """
     Infer (fill_hex, bg_hex) from the logo:
-    - average logo colour snapped to nearest PLEX palette for fill
+    - most common logo colour, after snapping each pixel to the nearest
+      PLEX palette entry, for fill
     - PLEX bg-main for background
     """
     try:
-        img = Image.open(logo_path).convert("RGBA")
+        fill_rgb = _logo_fill_rgb(str(logo_path), logo_path.stat().st_mtime_ns)
     except Exception as exc:  # noqa: BLE001
         print(f"[WARN] Could not open logo for colour inference: {exc}")
         # Fallback to classic black/white
         return "#000000", "#FFFFFF"
 
-    # Downscale to keep things cheap and smooth
-    img = img.resize((64, 64), Image.LANCZOS)
-    pixels = img.getdata()
-
-    total_r = total_g = total_b = count = 0
-    for r, g, b, a in pixels:
-        if a < 32:
-            continue  # skip near-transparent
-        # skip very bright whites
-        if r > 245 and g > 245 and b > 245:
-            continue
-        total_r += r
-        total_g += g
-        total_b += b
-        count += 1
-
-    if count == 0:
-        # If logo is basically all white/transparent, pick a nice default
-        fill_rgb = PLEX_PALETTE["deep_lilac"]
-    else:
-        avg_rgb = (total_r // count, total_g // count, total_b // count)
-        _, fill_rgb = nearest_palette_colour(avg_rgb)
-
     fill_hex = rgb_to_hex(fill_rgb)
     bg_rgb = PLEX_PALETTE["bg_main"]
     bg_hex = rgb_to_hex(bg_rgb)
     return fill_hex, bg_hex
 
 
+DATA_MODES = ["auto", "url", "tel", "email", "sms"]
+
+
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         description="Generate QR codes in seconds (with optional centre logo and PLEX-style auto colours)."
     )
     parser.add_argument(
         "data",
-        help="The text, URL, phone number, or email to encode."
+        nargs="?",
+        help="The text, URL, phone number, or email to encode (omit with --batch)."
     )
     parser.add_argument(
         "--out",
@@ -138,7 +263,7 @@ def build_parser() -> argparse.ArgumentParser:
     )
     parser.add_argument(
         "--mode",
-        choices=["auto", "url", "tel", "email", "sms"],
+        choices=DATA_MODES,
         default="auto",
         help=(
             "How to interpret the data: "
@@ -159,6 +284,13 @@ def build_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Infer QR colours from the logo using the PLEX palette (overrides --fill and --bg)."
     )
+    parser.add_argument(
+        "--batch",
+        help=(
+            "Path to a JSON list of jobs to generate in parallel. Each job is an object "
+            "with at least 'data' and 'out'; other keys override the command-line options."
+        ),
+    )
     return parser
 
 
@@ -178,6 +310,54 @@ def prepare_data(raw: str, mode: str) -> str:
     return raw
 
 
+@functools.lru_cache(maxsize=32)
+def _container_geom(qr_w: int) -> Tuple[int, int, int, int, int, int]:
+    """
+    Logo container layout for a QR of width qr_w:
+    (container_size, radius, margin, max_logo_w, max_logo_h, corner_offset).
+    """
+    # Central rounded container, slightly smaller to reduce white moat
+    container_size = int(qr_w * 0.26)
+    radius = int(container_size * 0.16)
+    margin = int(container_size * 0.06)  # smaller margin → minimal white gap
+    max_logo_w = container_size - 2 * margin
+    max_logo_h = container_size - 2 * margin
+    corner_offset = (qr_w - container_size) // 2
+    return container_size, radius, margin, max_logo_w, max_logo_h, corner_offset
+
+
+@functools.lru_cache(maxsize=8)
+def _rounded_mask(w: int, h: int, radius: int) -> Image.Image:
+    """
+    L-mode mask of a w x h rounded rectangle (255 inside, 0 outside).
+    Shared between calls; do not modify.
+    """
+    from PIL import Image, ImageDraw
+
+    mask = Image.new("L", (w, h), 0)
+    ImageDraw.Draw(mask).rounded_rectangle((0, 0, w, h), radius=radius, fill=255)
+    return mask
+
+
+@functools.lru_cache(maxsize=8)
+def _rounded_rect(w: int, h: int, radius: int, fill: str | Tuple[int, ...]) -> Image.Image:
+    """
+    RGBA flat-filled rounded rectangle, transparent outside the corners.
+    Shared between calls; copy before modifying.
+    """
+    from PIL import Image
+
+    # Flat fill plus the cached shape as alpha; no per-call rasterising
+    img = Image.new("RGBA", (w, h), fill)
+    mask = _rounded_mask(w, h, radius)
+    alpha = img.getpixel((0, 0))[3]
+    if alpha < 255:
+        # Keep a translucent fill (e.g. "#FFFFFF80") translucent inside the shape
+        mask = mask.point(lambda v: v * alpha // 255)
+    img.putalpha(mask)
+    return img
+
+
 def overlay_logo_with_container(qr_image: Image.Image, logo_path: Path) -> Image.Image:
     """
     Overlay a logo in a rounded white container at the centre of the QR.
@@ -185,41 +365,38 @@ def overlay_logo_with_container(qr_image: Image.Image, logo_path: Path) -> Image
     The container is about ~26% of the QR width with a slim border,
     so the logo feels tightly integrated.
     """
-    if not logo_path.is_file():
+    from PIL import Image, UnidentifiedImageError
+
+    try:
+        # copy: thumbnail() below resizes in place
+        logo = _load_logo(logo_path).copy()
+    except UnidentifiedImageError:
+        print(f"[WARN] Logo is not a readable image: {logo_path}")
+        return qr_image
+    except (FileNotFoundError, NotADirectoryError):
         print(f"[WARN] Logo path does not exist: {logo_path}")
         return qr_image
+    except OSError as exc:
+        # a directory, no permission, symlink loop, truncated data, ...
+        print(f"[WARN] Could not open logo: {exc}")
+        return qr_image
 
-    qr_image = qr_image.convert("RGBA")
-    qr_w, qr_h = qr_image.size
-
-    # Central rounded container, slightly smaller to reduce white moat
-    container_size = int(qr_w * 0.26)
-    container = Image.new("RGBA", (container_size, container_size), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(container)
-    radius = int(container_size * 0.16)
-    draw.rounded_rectangle(
-        (0, 0, container_size, container_size),
-        radius=radius,
-        fill=(255, 255, 255, 255),
-    )
+    if qr_image.mode != "RGBA":
+        qr_image = qr_image.convert("RGBA")
+    qr_w, _ = qr_image.size
 
-    c_x = (qr_w - container_size) // 2
-    c_y = (qr_h - container_size) // 2
-    qr_image.alpha_composite(container, (c_x, c_y))
+    container_size, radius, _, max_logo_w, max_logo_h, corner_offset = _container_geom(qr_w)
 
     # Logo inside container with very small margin (tight look)
-    logo = Image.open(logo_path).convert("RGBA")
-
-    margin = int(container_size * 0.06)  # smaller margin → minimal white gap
-    max_logo_w = container_size - 2 * margin
-    max_logo_h = container_size - 2 * margin
     logo.thumbnail((max_logo_w, max_logo_h), Image.LANCZOS)
-
     logo_w, logo_h = logo.size
-    l_x = c_x + (container_size - logo_w) // 2
-    l_y = c_y + (container_size - logo_h) // 2
 
-    qr_image.alpha_composite(logo, (l_x, l_y))
+    # Build container + logo off-screen so the QR gets a single composite pass
+    stamp = _rounded_rect(container_size, container_size, radius, (255, 255, 255, 255)).copy()
+    stamp.alpha_composite(logo, ((container_size - logo_w) // 2, (container_size - logo_h) // 2))
+
+    # QR images are square, so the same offset centres both axes
+    qr_image.alpha_composite(stamp, (corner_offset, corner_offset))
     return qr_image
 
 
@@ -228,7 +405,6 @@ def add_modern_frame(qr_image: Image.Image, bg: str) -> Image.Image:
     Place the QR on a slightly larger canvas with rounded corners
     to give it a modern, 'card-like' appearance with tight padding.
     """
-    qr_image = qr_image.convert("RGBA")
     qr_w, qr_h = qr_image.size
 
     # Tighter outer whitespace
@@ -236,29 +412,98 @@ def add_modern_frame(qr_image: Image.Image, bg: str) -> Image.Image:
     frame_w = qr_w + 2 * padding
     frame_h = qr_h + 2 * padding
 
-    canvas = Image.new("RGBA", (frame_w, frame_h), (0, 0, 0, 0))
-    draw = ImageDraw.Draw(canvas)
-
     radius = int(min(frame_w, frame_h) * 0.1)
-    draw.rounded_rectangle(
-        (0, 0, frame_w, frame_h),
-        radius=radius,
-        fill=bg,
+    # "transparent" (accepted for the QR background) isn't a Pillow colour;
+    # it gives a clear frame, so the QR just gains transparent padding
+    fill = (0, 0, 0, 0) if bg == "transparent" else bg
+    canvas = _rounded_rect(frame_w, frame_h, radius, fill).copy()
+
+    if qr_image.mode in ("RGBA", "LA", "PA") or "transparency" in qr_image.info:
+        if qr_image.mode != "RGBA":
+            qr_image = qr_image.convert("RGBA")
+        canvas.alpha_composite(qr_image, (padding, padding))
+    else:
+        # Opaque QR (no logo): paste() still converts it to RGBA internally,
+        # but skips the alpha blend that alpha_composite would do
+        canvas.paste(qr_image, (padding, padding))
+    return canvas
+
+
+def _qr_matrix(encoded: str, border: int, error_level: str) -> np.ndarray:
+    """
+    Encode the data into a 2D bool module matrix (True = dark), quiet zone
+    included.
+
+    Uses segno when it is installed (much faster encoding and mask
+    selection), otherwise falls back to the qrcode package.
+    error_level is one of "L", "M", "Q", "H".
+    """
+    import numpy as np
+
+    try:
+        import segno
+    except ImportError:
+        segno = None
+
+    if segno is not None:
+        qr = segno.make(encoded, error=error_level, micro=False, boost_error=False)
+        return np.pad(np.array(qr.matrix, dtype=np.uint8) != 0, border)
+
+    import qrcode
+
+    qr = qrcode.QRCode(
+        version=None,
+        error_correction=getattr(qrcode.constants, f"ERROR_CORRECT_{error_level}"),
+        border=border,
     )
+    qr.add_data(encoded)
+    qr.make(fit=True)
+    # get_matrix() already includes the border
+    return np.array(qr.get_matrix(), dtype=bool)
 
-    canvas.alpha_composite(qr_image, (padding, padding))
-    return canvas
+
+def _build_qr_image(encoded: str,
+                    size: int,
+                    border: int,
+                    error_level: str,
+                    fill: str,
+                    bg: str) -> Image.Image:
+    """
+    Encode the data and render it as a 2-colour palette image with
+    size x size pixels per module.
+
+    The matrix becomes pixels in one C-level pass (fromarray + nearest
+    upscale) instead of drawing every module as a rectangle.
+    """
+    import numpy as np
+    from PIL import Image, ImageColor
+
+    matrix = _qr_matrix(encoded, border, error_level)
+    img = Image.fromarray(matrix.astype(np.uint8), mode="P")
+    # Index 0 = background, 1 = modules. Colours are parsed by Pillow, as
+    # qrcode's PilImage did, and any alpha in "#RRGGBBAA" is dropped: qrcode
+    # rendered those onto an opaque RGB image.
+    # bg="transparent" (accepted by qrcode, not by Pillow) makes index 0 a
+    # transparent palette entry instead.
+    transparent_bg = bg == "transparent"
+    bg_rgb = (0, 0, 0) if transparent_bg else ImageColor.getrgb(bg)[:3]
+    img.putpalette([*bg_rgb, *ImageColor.getrgb(fill)[:3]])
+    h, w = matrix.shape
+    img = img.resize((w * size, h * size), Image.Resampling.NEAREST)
+    if transparent_bg:
+        img.info["transparency"] = 0
+    return img
 
 
 def generate_qr(data: str,
-                out: str,
-                size: int,
-                fill: str | None,
-                bg: str | None,
-                mode: str,
-                logo: str | None,
-                no_frame: bool,
-                auto_style: bool) -> None:
+                out: str = "qr.png",
+                size: int = 10,
+                fill: str | None = None,
+                bg: str | None = None,
+                mode: str = "auto",
+                logo: str | None = None,
+                no_frame: bool = False,
+                auto_style: bool = False) -> None:
     encoded = prepare_data(data, mode)
 
     logo_path = Path(logo) if logo else None
@@ -273,20 +518,11 @@ def generate_qr(data: str,
             bg = "white"
 
     # Higher error correction when we have a logo in the middle
-    error_level = (
-        qrcode.constants.ERROR_CORRECT_H if logo else qrcode.constants.ERROR_CORRECT_M
-    )
+    error_level = "H" if logo else "M"
 
-    qr = qrcode.QRCode(
-        version=None,
-        error_correction=error_level,
-        box_size=size,
-        border=4,
-    )
-    qr.add_data(encoded)
-    qr.make(fit=True)
-
-    img = qr.make_image(fill_color=fill, back_color=bg).convert("RGBA")
+    # 2-colour palette image; a bare QR is saved like this (1 bit per pixel),
+    # only the logo and frame steps convert to RGBA
+    img = _build_qr_image(encoded, size, 4, error_level, fill, bg)
 
     if logo_path is not None:
         img = overlay_logo_with_container(img, logo_path)
@@ -298,11 +534,55 @@ def generate_qr(data: str,
     print(f"[OK] Saved QR code to {out}")
 
 
+def _generate_qr_job(job: dict) -> None:
+    generate_qr(**job)
+
+
+def generate_qr_batch(jobs: list[dict], workers: int | None = None) -> None:
+    """
+    Run generate_qr once per job across a process pool.
+
+    Each job is a dict of generate_qr keyword arguments. Processes rather
+    than threads, since encoding and rendering are CPU-bound under the GIL.
+    """
+    from concurrent.futures import ProcessPoolExecutor
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Consume the results so errors from workers are raised here
+        list(executor.map(_generate_qr_job, jobs))
+
+
+# Expected JSON types of the batch job keys; None is allowed where the CLI
+# option defaults to None
+_BATCH_STR_KEYS = ("data", "out")
+_BATCH_OPTIONAL_STR_KEYS = ("fill", "bg", "logo")
+_BATCH_BOOL_KEYS = ("no_frame", "auto_style")
+
+
+def _batch_job_error(job: dict) -> str | None:
+    """Describe the first badly typed value in a batch job, or None if valid."""
+    for key in _BATCH_STR_KEYS:
+        if key in job and not isinstance(job[key], str):
+            return f"'{key}' must be a string"
+    for key in _BATCH_OPTIONAL_STR_KEYS:
+        if job.get(key) is not None and not isinstance(job[key], str):
+            return f"'{key}' must be a string or null"
+    for key in _BATCH_BOOL_KEYS:
+        if key in job and not isinstance(job[key], bool):
+            return f"'{key}' must be true or false"
+    # bool is an int subclass; reject it explicitly
+    if "size" in job and (not isinstance(job["size"], int) or isinstance(job["size"], bool)):
+        return "'size' must be an integer"
+    if "mode" in job and job["mode"] not in DATA_MODES:
+        return f"'mode' must be one of: {', '.join(DATA_MODES)}"
+    return None
+
+
 def main() -> None:
     parser = build_parser()
     args = parser.parse_args()
 
-    generate_qr(
+    options = dict(
         data=args.data,
         out=args.out,
         size=args.size,
@@ -314,6 +594,32 @@ def main() -> None:
         auto_style=args.auto_style,
     )
 
+    if args.batch:
+        if args.data is not None:
+            parser.error("data cannot be combined with --batch; put it in the batch file")
+        try:
+            jobs = json.loads(Path(args.batch).read_text())
+        except (OSError, ValueError) as exc:
+            parser.error(f"could not read batch file: {exc}")
+        if not isinstance(jobs, list) or not all(
+            isinstance(job, dict) and "data" in job and "out" in job for job in jobs
+        ):
+            parser.error("batch file must be a JSON list of objects with 'data' and 'out'")
+        unknown = {key for job in jobs for key in job} - options.keys()
+        if unknown:
+            parser.error(f"unknown keys in batch file: {', '.join(sorted(unknown))}")
+        for i, job in enumerate(jobs):
+            error = _batch_job_error(job)
+            if error:
+                parser.error(f"batch job {i}: {error}")
+        generate_qr_batch([{**options, **job} for job in jobs])
+        return
+
+    if args.data is None:
+        parser.error("the following arguments are required: data (or --batch)")
+
+    generate_qr(**options)
+
 
 if __name__ == "__main__":
     main()